@@ -4,32 +4,46 @@ Main application entry point with all endpoints
 """
 
 import os
+import asyncio
 import logging
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
-import json
 import zipfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import orjson
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, Depends, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+import anyio
 from pydantic import BaseModel, ValidationError
 from sqlmodel import Session, select
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload, raiseload
 
 from models import (
-    Account, Source, Claim, Activity, Asset,
-    engine, create_db_and_tables
+    Account, Source, Claim, Activity, Asset, Job,
+    engine, create_db_and_tables, utcnow
 )
 from schemas import (
     ProspectCreateRequest, CompanyProfile, EmailDraft, 
     PitchOutline, MeetingSummary, GenerateAssetsRequest
 )
-from services import LLMService, ExtractionService, AssetService
+from services import (
+    LLMService, ExtractionService, build_landing_page,
+    get_llm_service, get_extraction_service, get_asset_service,
+    ASSETS_DIR, TEMPLATES_DIR
+)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +51,7 @@ logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title="Source-to-Sell API",
     description="Prospect research and asset generation API",
     version="1.0.0"
@@ -51,21 +66,360 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-llm_service = LLMService()
-extraction_service = ExtractionService()
-asset_service = AssetService()
+# Compress larger responses (account details, listings, dashboard HTML)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Templates and static files
-templates = Jinja2Templates(directory="templates")
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
 app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/assets", StaticFiles(directory="assets"), name="assets")
+app.mount("/assets", StaticFiles(directory=ASSETS_DIR), name="assets")
+
+# Worker threads available to sync endpoints and run_in_threadpool calls
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "80"))
+
+# Background workers for profile/asset generation (max jobs running at once)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
 
 # Database dependency
 def get_session():
     with Session(engine) as session:
         yield session
 
+# Account listings: latest rendered body per view, keyed by ETag
+_listing_cache: Dict[str, Tuple[str, bytes]] = {}
+
+def _accounts_fingerprint(session: Session) -> str:
+    """Cheap fingerprint of the accounts table that changes on any insert, update or delete"""
+    count, last_updated = session.exec(
+        select(func.count(Account.id), func.max(Account.updated_at))
+    ).one()
+    return f"{count}-{last_updated.timestamp() if last_updated else 0}"
+
+def _cached_listing(
+    request: Request,
+    session: Session,
+    view: str,
+    media_type: str,
+    render: Callable[[], bytes]
+) -> Response:
+    """Serve an account listing with ETag revalidation and a cached body"""
+    etag = f'"{view}-{_accounts_fingerprint(session)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    cached = _listing_cache.get(view)
+    if cached and cached[0] == etag:
+        body = cached[1]
+    else:
+        body = render()
+        _listing_cache[view] = (etag, body)
+    return Response(content=body, media_type=media_type, headers={"ETag": etag})
+
+# Blocking database helpers for async endpoints (run via run_in_threadpool)
+
+def _get_or_create_account(session: Session, request: ProspectCreateRequest, domain: str) -> Account:
+    """Find account by domain or create a new one"""
+    existing_account = session.exec(
+        select(Account).where(Account.domain == domain)
+    ).first()
+    
+    if existing_account:
+        logger.info(f"Found existing account: {existing_account.name} ({domain})")
+        return existing_account
+    
+    account = Account(
+        name=request.company_name or domain,
+        domain=domain,
+        website=request.company_url
+    )
+    session.add(account)
+    session.commit()
+    session.refresh(account)
+    logger.info(f"Created new account: {account.name} ({domain})")
+    return account
+
+def _filter_new_urls(session: Session, account_id: int, urls: List[str]) -> List[str]:
+    """Return URLs that have not been fetched for this account yet"""
+    existing_urls = set(session.exec(
+        select(Source.url).where(
+            Source.account_id == account_id,
+            Source.url.in_(urls)
+        )
+    ).all())
+    return [url for url in urls if url not in existing_urls]
+
+def _get_account_or_404(session: Session, account_id: int) -> Account:
+    account = session.get(Account, account_id)
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return account
+
+def _load_profile_inputs(session: Session, account_id: int):
+    """Load account and its successful sources for profile generation"""
+    account = _get_account_or_404(session, account_id)
+    
+    sources = session.exec(
+        select(Source).where(
+            Source.account_id == account_id,
+            Source.status == "success"
+        )
+    ).all()
+    
+    if not sources:
+        raise HTTPException(
+            status_code=400, 
+            detail="No successful sources found for this account"
+        )
+    return account, sources
+
+def _save_profile(session: Session, account: Account, profile: CompanyProfile) -> None:
+    """Update account with profile data and replace its claims"""
+    account.industry = profile.industry
+    account.size_hint = profile.size_hint
+    account.summary = f"{profile.company_name} - {', '.join(profile.products) if profile.products else 'N/A'}"
+    
+    # Clear existing claims with a single DELETE and bulk insert new ones
+    session.exec(delete(Claim).where(Claim.account_id == account.id))
+    
+    session.bulk_save_objects([
+        Claim(
+            account_id=account.id,
+            text=claim_data.text,
+            source_url=claim_data.source_url,
+            evidence_quote=claim_data.evidence_quote,
+            confidence=claim_data.confidence
+        )
+        for claim_data in profile.claims
+    ])
+    
+    session.commit()
+
+def _load_asset_inputs(session: Session, account_id: int):
+    """Load account and its claims for asset generation"""
+    account = _get_account_or_404(session, account_id)
+    
+    # Get latest claims for context
+    claims = session.exec(
+        select(Claim).where(Claim.account_id == account_id)
+    ).all()
+    
+    if not claims:
+        raise HTTPException(
+            status_code=400,
+            detail="No profile data found. Generate profile first."
+        )
+    return account, claims
+
+def _save_assets(session: Session, account_id: int, assets_data: List[tuple]) -> None:
+    """Point each asset kind at its newly generated file"""
+    stmt = sqlite_insert(Asset).values([
+        {"account_id": account_id, "kind": asset_kind, "path": file_path}
+        for asset_kind, file_path in assets_data
+    ])
+    # One asset per kind (unique index), so replace the existing row in place
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["account_id", "kind"],
+        set_={"path": stmt.excluded.path, "created_at": utcnow()}
+    )
+    session.exec(stmt)
+    session.commit()
+
+def _save_sources(session: Session, sources: List[Source]) -> None:
+    """Insert fetched sources, ignoring URLs already stored for the account"""
+    if not sources:
+        return
+    stmt = sqlite_insert(Source).values([
+        source.model_dump(exclude={"id"}, exclude_none=True) for source in sources
+    ]).on_conflict_do_nothing(index_elements=["account_id", "url"])
+    session.exec(stmt)
+    session.commit()
+
+def _save_activity(session: Session, activity: Activity) -> int:
+    """Persist activity and return its id"""
+    session.add(activity)
+    session.commit()
+    session.refresh(activity)
+    return activity.id
+
+def _create_job(session: Session, kind: str, account_id: int) -> int:
+    """Record a queued job and return its id"""
+    job = Job(account_id=account_id, kind=kind)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job.id
+
+def _update_job(job_id: int, **fields) -> None:
+    """Set status/result/error on a job (no-op if its account was deleted)"""
+    with Session(engine) as session:
+        session.exec(update(Job).where(Job.id == job_id).values(**fields))
+        session.commit()
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process other than this one is running under ``pid``"""
+    if pid == os.getpid():
+        # This process just started, so the pid belonged to an exited predecessor
+        return False
+    if os.name != "posix":
+        # No safe liveness probe; leave the job to its owner
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _fail_interrupted_jobs() -> None:
+    """Fail unfinished jobs whose owning process has exited"""
+    with Session(engine) as session:
+        owners = session.exec(
+            select(Job.owner_pid)
+            .where(Job.status.in_(("queued", "running")))
+            .distinct()
+        ).all()
+        exited = [pid for pid in owners if not _process_alive(pid)]
+        if not exited:
+            return
+        session.exec(
+            update(Job)
+            .where(Job.status.in_(("queued", "running")), Job.owner_pid.in_(exited))
+            .values(status="error", error="Interrupted by server restart")
+        )
+        session.commit()
+
+# Background job processing
+
+async def _run_profile_job(account_id: int) -> Dict[str, Any]:
+    """Generate company profile using LLM with provenance"""
+    start_time = time.time()
+    
+    with Session(engine) as session:
+        account, sources = await run_in_threadpool(
+            _load_profile_inputs, session, account_id
+        )
+        
+        # Generate profile using LLM
+        profile = await get_llm_service().generate_profile(account, sources)
+        
+        await run_in_threadpool(_save_profile, session, account, profile)
+    
+    elapsed = time.time() - start_time
+    
+    # Calculate provenance metrics
+    sourced_claims = len([c for c in profile.claims if c.source_url])
+    total_claims = len(profile.claims)
+    provenance_coverage = sourced_claims / total_claims if total_claims > 0 else 0
+    
+    logger.info(f"Profile generated in {elapsed:.2f}s, provenance: {provenance_coverage:.2%}")
+    
+    return {
+        "profile": profile,
+        "processing_time": elapsed,
+        "provenance_coverage": provenance_coverage,
+        "claims_count": total_claims
+    }
+
+async def _run_assets_job(account_id: int, persona: str) -> Dict[str, Any]:
+    """Generate email, pitch, and landing page assets"""
+    start_time = time.time()
+    
+    with Session(engine) as session:
+        account, claims = await run_in_threadpool(
+            _load_asset_inputs, session, account_id
+        )
+        
+        llm_service = get_llm_service()
+        asset_service = get_asset_service()
+        
+        # Generate assets (email and pitch are independent LLM calls)
+        email_draft, pitch_outline = await asyncio.gather(
+            llm_service.generate_email(account, claims, persona),
+            llm_service.generate_pitch(account, claims)
+        )
+        
+        # Create asset files off the event loop, in parallel. The landing page
+        # zip is CPU-bound, so it runs in the process pool on plain dicts.
+        loop = asyncio.get_running_loop()
+        email_path, pitch_path, landing_zip_path = await asyncio.gather(
+            asyncio.to_thread(asset_service.create_email_file, account_id, email_draft),
+            asyncio.to_thread(asset_service.create_pitch_file, account_id, pitch_outline),
+            loop.run_in_executor(
+                app.state.proc_pool,
+                build_landing_page,
+                account.model_dump(),
+                [claim.model_dump() for claim in claims],
+                email_draft
+            )
+        )
+        
+        # Save asset records
+        assets_data = [
+            ("email", email_path),
+            ("pitch_md", pitch_path),
+            ("landing_zip", landing_zip_path)
+        ]
+        
+        await run_in_threadpool(_save_assets, session, account_id, assets_data)
+    
+    elapsed = time.time() - start_time
+    logger.info(f"Assets generated in {elapsed:.2f}s")
+    
+    return {
+        "email_draft": email_draft,
+        "pitch_outline": pitch_outline,
+        "assets": {
+            "email_path": email_path,
+            "pitch_path": pitch_path,
+            "landing_zip_path": landing_zip_path
+        },
+        "processing_time": elapsed
+    }
+
+JOB_HANDLERS = {
+    "profile": _run_profile_job,
+    "assets": _run_assets_job,
+}
+
+async def _run_job(job: Dict[str, Any]) -> None:
+    """Run one queued job and record its outcome (never raises)"""
+    job_id = job["job_id"]
+    try:
+        await run_in_threadpool(_update_job, job_id, status="running")
+        result = await JOB_HANDLERS[job["kind"]](job["account_id"], **job["params"])
+        await run_in_threadpool(
+            _update_job, job_id, status="done", result=jsonable_encoder(result)
+        )
+    except Exception as e:
+        error = e.detail if isinstance(e, HTTPException) else str(e)
+        logger.error(f"Error running {job['kind']} job {job_id}: {error}")
+        try:
+            await run_in_threadpool(_update_job, job_id, status="error", error=error)
+        except Exception as update_error:
+            # Keep the worker alive even if the failure can't be recorded
+            logger.error(f"Could not record failure of job {job_id}: {update_error}")
+
+async def job_worker(queue: asyncio.Queue) -> None:
+    """Process queued generation jobs one at a time, recording results in the jobs table"""
+    while True:
+        job = await queue.get()
+        try:
+            await _run_job(job)
+        finally:
+            queue.task_done()
+
+async def _enqueue_job(session: Session, kind: str, account_id: int, **params) -> Dict[str, Any]:
+    """Record a job and hand it to the background workers"""
+    job_id = await run_in_threadpool(_create_job, session, kind, account_id)
+    await app.state.job_queue.put({
+        "job_id": job_id,
+        "kind": kind,
+        "account_id": account_id,
+        "params": params
+    })
+    return {"job_id": job_id, "status": "queued"}
+
 # Request/Response timing middleware
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
@@ -81,7 +435,8 @@ async def add_process_time_header(request: Request, call_next):
 @app.post("/prospects/create")
 async def create_prospect(
     request: ProspectCreateRequest,
-    session: Session = Depends(get_session)
+    session: Session = Depends(get_session),
+    extraction_service: ExtractionService = Depends(get_extraction_service)
 ):
     """Create or update prospect account and fetch sources"""
     try:
@@ -90,74 +445,55 @@ async def create_prospect(
         # Extract domain from company URL for deduplication
         domain = extraction_service.extract_domain(request.company_url)
         
-        # Check for existing account by domain
-        existing_account = session.exec(
-            select(Account).where(Account.domain == domain)
-        ).first()
-        
-        if existing_account:
-            account = existing_account
-            logger.info(f"Found existing account: {account.name} ({domain})")
-        else:
-            # Create new account
-            account = Account(
-                name=request.company_name or domain,
-                domain=domain,
-                website=request.company_url,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            session.add(account)
-            session.commit()
-            session.refresh(account)
-            logger.info(f"Created new account: {account.name} ({domain})")
+        account = await run_in_threadpool(
+            _get_or_create_account, session, request, domain
+        )
+        account_id = account.id
         
         # Collect all URLs to fetch
         urls_to_fetch = [request.company_url]
         if request.extra_urls:
             urls_to_fetch.extend([url for url in request.extra_urls if url])
+        urls_to_fetch = list(dict.fromkeys(urls_to_fetch))
         
-        # Fetch and extract content from URLs
-        for url in urls_to_fetch:
-            # Check if source already exists
-            existing_source = session.exec(
-                select(Source).where(
-                    Source.account_id == account.id,
-                    Source.url == url
+        # Skip URLs that were already fetched for this account
+        new_urls = await run_in_threadpool(
+            _filter_new_urls, session, account_id, urls_to_fetch
+        )
+        
+        # Fetch and extract all new URLs in one batch over the shared HTTP session
+        contents = await extraction_service.extract_content_batch(
+            app.state.http_session, new_urls
+        )
+        
+        sources = []
+        for url, content in zip(new_urls, contents):
+            if "error" in content:
+                logger.error(f"Failed to fetch {url}: {content['error']}")
+                source = Source(
+                    account_id=account_id,
+                    url=url,
+                    title="",
+                    raw_text="",
+                    status=f"error: {content['error']}"
                 )
-            ).first()
-            
-            if not existing_source:
-                try:
-                    content = extraction_service.extract_content(url)
-                    source = Source(
-                        account_id=account.id,
-                        url=url,
-                        title=content.get("title", ""),
-                        raw_text=content.get("text", "")[:10000],  # Limit text size
-                        fetched_at=datetime.utcnow(),
-                        status="success"
-                    )
-                    session.add(source)
-                except Exception as e:
-                    logger.error(f"Failed to fetch {url}: {str(e)}")
-                    source = Source(
-                        account_id=account.id,
-                        url=url,
-                        title="",
-                        raw_text="",
-                        fetched_at=datetime.utcnow(),
-                        status=f"error: {str(e)}"
-                    )
-                    session.add(source)
+            else:
+                source = Source(
+                    account_id=account_id,
+                    url=url,
+                    title=content.get("title", ""),
+                    raw_text=content.get("text", "")[:10000],  # Limit text size
+                    status="success"
+                )
+            sources.append(source)
         
-        session.commit()
+        await run_in_threadpool(_save_sources, session, sources)
         
         elapsed = time.time() - start_time
         logger.info(f"Prospect creation completed in {elapsed:.2f}s")
         
         return {
-            "account_id": account.id,
+            "account_id": account_id,
             "message": "Account created/updated successfully",
             "sources_fetched": len(urls_to_fetch),
             "processing_time": elapsed
@@ -168,253 +504,150 @@ async def create_prospect(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/accounts")
-async def list_accounts(session: Session = Depends(get_session)):
+def list_accounts(request: Request, session: Session = Depends(get_session)):
     """List all accounts"""
-    accounts = session.exec(select(Account)).all()
-    return [
-        {
-            "id": account.id,
-            "name": account.name,
-            "domain": account.domain,
-            "website": account.website,
-            "industry": account.industry,
-            "created_at": account.created_at,
-            "updated_at": account.updated_at
-        }
-        for account in accounts
-    ]
+    def render() -> bytes:
+        # raiseload turns accidental lazy relationship access into an error (no N+1)
+        accounts = session.exec(select(Account).options(raiseload("*"))).all()
+        return orjson.dumps([
+            {
+                "id": account.id,
+                "name": account.name,
+                "domain": account.domain,
+                "website": account.website,
+                "industry": account.industry,
+                "created_at": account.created_at,
+                "updated_at": account.updated_at
+            }
+            for account in accounts
+        ])
+    
+    return _cached_listing(request, session, "accounts", "application/json", render)
 
-@app.get("/accounts/{account_id}")
-async def get_account(account_id: int, session: Session = Depends(get_session)):
-    """Get account details with all related data"""
-    account = session.get(Account, account_id)
+def _load_account_detail(
+    session: Session, account_id: int, include_source_text: bool = True
+) -> Dict[str, Any]:
+    """Load account with all related data"""
+    sources_option = selectinload(Account.sources)
+    if not include_source_text:
+        # raw_text is the bulk of the payload; fetch it via /sources/{id}/text
+        sources_option = sources_option.load_only(
+            Source.id, Source.account_id, Source.url,
+            Source.title, Source.status, Source.fetched_at
+        )
+    
+    # One query for the account plus one batched query per relationship
+    account = session.exec(
+        select(Account)
+        .where(Account.id == account_id)
+        .options(
+            sources_option,
+            selectinload(Account.claims),
+            selectinload(Account.activities),
+            selectinload(Account.assets)
+        )
+    ).first()
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     
-    # Get related data
-    sources = session.exec(
-        select(Source).where(Source.account_id == account_id)
-    ).all()
-    
-    claims = session.exec(
-        select(Claim).where(Claim.account_id == account_id)
-    ).all()
-    
-    activities = session.exec(
-        select(Activity).where(Activity.account_id == account_id)
-    ).all()
+    return {
+        "account": account,
+        "sources": account.sources,
+        "claims": account.claims,
+        "activities": account.activities,
+        "assets": account.assets
+    }
+
+@app.get("/accounts/{account_id}")
+def get_account(account_id: int, session: Session = Depends(get_session)):
+    """Get account details with all related data (source text omitted)"""
+    account_data = _load_account_detail(
+        session, account_id, include_source_text=False
+    )
     
-    assets = session.exec(
-        select(Asset).where(Asset.account_id == account_id)
-    ).all()
+    # Dump rows straight to orjson, skipping FastAPI's jsonable_encoder walk
+    return ORJSONResponse({
+        "account": account_data["account"].model_dump(),
+        **{
+            key: [row.model_dump() for row in account_data[key]]
+            for key in ("sources", "claims", "activities", "assets")
+        }
+    })
+
+@app.get("/sources/{source_id}/text")
+def get_source_text(source_id: int, session: Session = Depends(get_session)):
+    """Get the extracted text of a single source"""
+    source = session.get(Source, source_id)
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
     
     return {
-        "account": account,
-        "sources": sources,
-        "claims": claims,
-        "activities": activities,
-        "assets": assets
+        "id": source.id,
+        "account_id": source.account_id,
+        "url": source.url,
+        "title": source.title,
+        "raw_text": source.raw_text
     }
 
-@app.post("/accounts/{account_id}/generate_profile")
+@app.post("/accounts/{account_id}/generate_profile", status_code=202)
 async def generate_profile(
     account_id: int,
     session: Session = Depends(get_session)
 ):
-    """Generate company profile using LLM with provenance"""
-    try:
-        start_time = time.time()
-        
-        account = session.get(Account, account_id)
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-        
-        # Get sources for context
-        sources = session.exec(
-            select(Source).where(
-                Source.account_id == account_id,
-                Source.status == "success"
-            )
-        ).all()
-        
-        if not sources:
-            raise HTTPException(
-                status_code=400, 
-                detail="No successful sources found for this account"
-            )
-        
-        # Generate profile using LLM
-        profile = await llm_service.generate_profile(account, sources)
-        
-        # Update account with profile data
-        account.industry = profile.industry
-        account.size_hint = profile.size_hint
-        account.summary = f"{profile.company_name} - {', '.join(profile.products) if profile.products else 'N/A'}"
-        account.updated_at = datetime.utcnow()
-        
-        # Clear existing claims and add new ones
-        existing_claims = session.exec(
-            select(Claim).where(Claim.account_id == account_id)
-        ).all()
-        for claim in existing_claims:
-            session.delete(claim)
-        
-        # Add new claims
-        for claim_data in profile.claims:
-            claim = Claim(
-                account_id=account_id,
-                text=claim_data.text,
-                source_url=claim_data.source_url,
-                evidence_quote=claim_data.evidence_quote,
-                confidence=claim_data.confidence,
-                created_at=datetime.utcnow()
-            )
-            session.add(claim)
-        
-        session.commit()
-        
-        elapsed = time.time() - start_time
-        
-        # Calculate provenance metrics
-        sourced_claims = len([c for c in profile.claims if c.source_url])
-        total_claims = len(profile.claims)
-        provenance_coverage = sourced_claims / total_claims if total_claims > 0 else 0
-        
-        logger.info(f"Profile generated in {elapsed:.2f}s, provenance: {provenance_coverage:.2%}")
-        
-        return {
-            "profile": profile,
-            "processing_time": elapsed,
-            "provenance_coverage": provenance_coverage,
-            "claims_count": total_claims
-        }
-        
-    except Exception as e:
-        logger.error(f"Error generating profile: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Queue company profile generation; poll /jobs/{job_id} for the result"""
+    # Validate up front so a missing account or sources fails the request itself
+    await run_in_threadpool(_load_profile_inputs, session, account_id)
+    return await _enqueue_job(session, "profile", account_id)
 
-@app.post("/accounts/{account_id}/generate_assets")
+@app.post("/accounts/{account_id}/generate_assets", status_code=202)
 async def generate_assets(
     account_id: int,
     request: GenerateAssetsRequest,
     session: Session = Depends(get_session)
 ):
-    """Generate email, pitch, and landing page assets"""
-    try:
-        start_time = time.time()
-        
-        account = session.get(Account, account_id)
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-        
-        # Get latest claims for context
-        claims = session.exec(
-            select(Claim).where(Claim.account_id == account_id)
-        ).all()
-        
-        if not claims:
-            raise HTTPException(
-                status_code=400,
-                detail="No profile data found. Generate profile first."
-            )
-        
-        # Generate assets
-        email_draft = await llm_service.generate_email(
-            account, claims, request.persona
-        )
-        pitch_outline = await llm_service.generate_pitch(account, claims)
-        
-        # Create asset files
-        email_path = asset_service.create_email_file(account_id, email_draft)
-        pitch_path = asset_service.create_pitch_file(account_id, pitch_outline)
-        landing_zip_path = asset_service.create_landing_page(
-            account, claims, email_draft
-        )
-        
-        # Save asset records
-        assets_data = [
-            ("email", email_path),
-            ("pitch_md", pitch_path),
-            ("landing_zip", landing_zip_path)
-        ]
-        
-        for asset_kind, file_path in assets_data:
-            # Remove existing asset of same type
-            existing = session.exec(
-                select(Asset).where(
-                    Asset.account_id == account_id,
-                    Asset.kind == asset_kind
-                )
-            ).first()
-            if existing:
-                session.delete(existing)
-            
-            # Add new asset
-            asset = Asset(
-                account_id=account_id,
-                kind=asset_kind,
-                path=file_path,
-                created_at=datetime.utcnow()
-            )
-            session.add(asset)
-        
-        session.commit()
-        
-        elapsed = time.time() - start_time
-        logger.info(f"Assets generated in {elapsed:.2f}s")
-        
-        return {
-            "email_draft": email_draft,
-            "pitch_outline": pitch_outline,
-            "assets": {
-                "email_path": email_path,
-                "pitch_path": pitch_path,
-                "landing_zip_path": landing_zip_path
-            },
-            "processing_time": elapsed
-        }
-        
-    except Exception as e:
-        logger.error(f"Error generating assets: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Queue email, pitch, and landing page generation; poll /jobs/{job_id} for the result"""
+    await run_in_threadpool(_load_asset_inputs, session, account_id)
+    return await _enqueue_job(session, "assets", account_id, persona=request.persona)
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: int, session: Session = Depends(get_session)):
+    """Get status and result of a background job"""
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.model_dump()
 
 @app.post("/accounts/{account_id}/upload_transcript")
 async def upload_transcript(
     account_id: int,
     file: UploadFile = File(...),
-    session: Session = Depends(get_session)
+    session: Session = Depends(get_session),
+    llm_service: LLMService = Depends(get_llm_service)
 ):
     """Upload and summarize meeting transcript"""
     try:
         start_time = time.time()
         
-        account = session.get(Account, account_id)
-        if not account:
-            raise HTTPException(status_code=404, detail="Account not found")
-        
-        # Read transcript content
-        content = await file.read()
-        transcript_text = content.decode('utf-8')
+        await run_in_threadpool(_get_account_or_404, session, account_id)
         
-        # Generate meeting summary
-        meeting_summary = await llm_service.generate_meeting_summary(transcript_text)
+        # Hand the spooled upload straight to the service, which decodes only
+        # the part of the transcript it needs (no full read into bytes)
+        meeting_summary = await llm_service.generate_meeting_summary(file.file)
         
         # Create activity record
         activity = Activity(
             account_id=account_id,
             type="call_summary",
-            content=meeting_summary.dict(),
-            created_at=datetime.utcnow()
+            content=meeting_summary.model_dump()
         )
-        session.add(activity)
-        session.commit()
+        activity_id = await run_in_threadpool(_save_activity, session, activity)
         
         elapsed = time.time() - start_time
         logger.info(f"Transcript processed in {elapsed:.2f}s")
         
         return {
             "meeting_summary": meeting_summary,
-            "activity_id": activity.id,
+            "activity_id": activity_id,
             "processing_time": elapsed
         }
         
@@ -423,29 +656,25 @@ async def upload_transcript(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/accounts/{account_id}")
-async def delete_account(account_id: int, session: Session = Depends(get_session)):
+def delete_account(account_id: int, session: Session = Depends(get_session)):
     """Hard delete account and all related data"""
     try:
         account = session.get(Account, account_id)
         if not account:
             raise HTTPException(status_code=404, detail="Account not found")
         
-        # Delete related records (cascading)
-        related_tables = [Source, Claim, Activity, Asset]
+        # Delete related records (cascading), one DELETE statement per table
+        related_tables = [Source, Claim, Activity, Asset, Job]
         for table in related_tables:
-            records = session.exec(
-                select(table).where(table.account_id == account_id)
-            ).all()
-            for record in records:
-                session.delete(record)
+            session.exec(delete(table).where(table.account_id == account_id))
         
         # Delete asset files
-        assets_dir = Path(f"assets/account_{account_id}")
+        assets_dir = ASSETS_DIR / f"account_{account_id}"
         if assets_dir.exists():
             shutil.rmtree(assets_dir)
         
-        # Delete account
-        session.delete(account)
+        # Delete account (Core DELETE so the ORM doesn't load children to unlink)
+        session.exec(delete(Account).where(Account.id == account_id))
         session.commit()
         
         logger.info(f"Account {account_id} deleted successfully")
@@ -459,29 +688,37 @@ async def delete_account(account_id: int, session: Session = Depends(get_session
 # Web UI Routes
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request, session: Session = Depends(get_session)):
+def dashboard(request: Request, session: Session = Depends(get_session)):
     """Main dashboard page"""
-    accounts = session.exec(select(Account)).all()
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {"request": request, "accounts": accounts}
-    )
+    def render() -> bytes:
+        # Only the columns the template shows, as plain rows (no ORM hydration)
+        accounts = session.exec(
+            select(
+                Account.id, Account.name, Account.domain,
+                Account.industry, Account.created_at
+            )
+        ).all()
+        return templates.get_template("dashboard.html").render(
+            request=request, accounts=accounts
+        ).encode()
+    
+    return _cached_listing(request, session, "dashboard", "text/html", render)
 
 @app.get("/accounts/{account_id}/view", response_class=HTMLResponse)
-async def account_detail(
+def account_detail(
     request: Request,
     account_id: int,
     session: Session = Depends(get_session)
 ):
     """Account detail page"""
-    account_data = await get_account(account_id, session)
+    account_data = _load_account_detail(session, account_id)
     return templates.TemplateResponse(
         "account_detail.html",
         {"request": request, **account_data}
     )
 
 @app.get("/download/{asset_type}/{account_id}")
-async def download_asset(
+def download_asset(
     asset_type: str,
     account_id: int,
     session: Session = Depends(get_session)
@@ -519,13 +756,42 @@ async def startup_event():
     """Initialize database and create directories"""
     create_db_and_tables()
     
+    # Sync endpoints run on this threadpool; raise the default limit of 40
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
     # Create necessary directories
-    directories = ["assets", "static", "templates"]
+    directories = [ASSETS_DIR, Path("static"), TEMPLATES_DIR]
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+        directory.mkdir(exist_ok=True)
+    
+    # Build the LLM service now so its configuration warnings show at startup
+    get_llm_service()
+    
+    # Shared HTTP session so source fetches reuse pooled connections
+    app.state.http_session = get_extraction_service().create_http_session()
+    
+    # Worker processes for CPU-bound asset building (keeps the GIL free)
+    app.state.proc_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    
+    # Profile/asset generation runs on background workers, off the request path
+    _fail_interrupted_jobs()
+    app.state.job_queue = asyncio.Queue()
+    app.state.job_workers = [
+        asyncio.create_task(job_worker(app.state.job_queue))
+        for _ in range(JOB_WORKERS)
+    ]
     
     logger.info("Source-to-Sell API started successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources"""
+    for worker in app.state.job_workers:
+        worker.cancel()
+    await app.state.http_session.close()
+    # Don't block the event loop; queued landing builds are dropped with their jobs
+    app.state.proc_pool.shutdown(wait=False, cancel_futures=True)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -4,13 +4,90 @@ All tables as specified in tech spec section 4.2
 """
 
 from datetime import datetime
-from typing import Optional, Any
-from sqlmodel import SQLModel, Field, create_engine, Session
+from typing import Optional, Any, Dict, List
+from sqlalchemy import JSON, Column, DateTime, Index, event, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import expression
+from sqlmodel import SQLModel, Field, Relationship, create_engine, Session
 import os
 
+import orjson
+
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./app.db")
-engine = create_engine(DATABASE_URL, echo=False)
+
+# Pool sized so the API threadpool workers can each hold a connection
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "60"))
+
+# Applied to every new SQLite connection: WAL lets readers proceed during a
+# write and synchronous=NORMAL skips the fsync on each commit (safe in WAL)
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+]
+
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+# JSON columns (activity content, job results) encode/decode with orjson,
+# which also handles the dates in meeting summaries
+JSON_ENGINE_ARGS = {
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
+}
+
+if DATABASE_URL.startswith("sqlite"):
+    # In-memory databases use SQLAlchemy's single-connection pool, which
+    # takes no sizing arguments
+    database = make_url(DATABASE_URL).database
+    if database and database != ":memory:":
+        pool_args = {"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW}
+    else:
+        pool_args = {}
+    engine = create_engine(
+        DATABASE_URL,
+        echo=False,
+        **JSON_ENGINE_ARGS,
+        connect_args={"check_same_thread": False},
+        **pool_args
+    )
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+else:
+    engine = create_engine(DATABASE_URL, echo=False, **JSON_ENGINE_ARGS)
+
+class utcnow(expression.FunctionElement):
+    """Current UTC timestamp, computed by the database"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP only has second resolution on SQLite
+    return "(strftime('%Y-%m-%d %H:%M:%f', 'now'))"
+
+def timestamp_column(on_update: bool = False) -> Column:
+    """Timestamp column filled in server-side on insert (and optionally update)"""
+    return Column(
+        DateTime,
+        server_default=utcnow(),
+        onupdate=utcnow() if on_update else None,
+        nullable=False
+    )
 
 class Account(SQLModel, table=True):
     """Company/prospect accounts"""
@@ -23,52 +100,85 @@ class Account(SQLModel, table=True):
     industry: Optional[str] = None
     size_hint: Optional[str] = None
     summary: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column(on_update=True))
+    
+    sources: List["Source"] = Relationship(back_populates="account")
+    claims: List["Claim"] = Relationship(back_populates="account")
+    activities: List["Activity"] = Relationship(back_populates="account")
+    assets: List["Asset"] = Relationship(back_populates="account")
 
 class Source(SQLModel, table=True):
     """URL sources and extracted content"""
     __tablename__ = "sources"
+    __table_args__ = (
+        Index("ix_source_account_url", "account_id", "url", unique=True),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     account_id: int = Field(foreign_key="accounts.id")
     url: str
     title: str = ""
     raw_text: str = ""
-    fetched_at: datetime = Field(default_factory=datetime.utcnow)
+    fetched_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
     status: str = "pending"  # success, error, pending
+    
+    account: Optional[Account] = Relationship(back_populates="sources")
 
 class Claim(SQLModel, table=True):
     """Profile claims with provenance"""
     __tablename__ = "claims"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    account_id: int = Field(foreign_key="accounts.id")
+    account_id: int = Field(foreign_key="accounts.id", index=True)
     text: str
     source_url: Optional[str] = None
     evidence_quote: Optional[str] = None
     confidence: float = 0.0
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+    
+    account: Optional[Account] = Relationship(back_populates="claims")
 
 class Activity(SQLModel, table=True):
     """Meeting summaries and notes"""
     __tablename__ = "activities"
     
     id: Optional[int] = Field(default=None, primary_key=True)
-    account_id: int = Field(foreign_key="accounts.id")
+    account_id: int = Field(foreign_key="accounts.id", index=True)
     type: str  # call_summary, note
-    content: str  # JSON string for structured data
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    content: Dict[str, Any] = Field(sa_column=Column(JSON, nullable=False))  # structured data
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+    
+    account: Optional[Account] = Relationship(back_populates="activities")
 
 class Asset(SQLModel, table=True):
     """Generated assets (email, pitch, landing page)"""
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_asset_account_kind", "account_id", "kind", unique=True),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     account_id: int = Field(foreign_key="accounts.id")
     kind: str  # email, pitch_md, landing_zip
     path: str  # file path
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+    
+    account: Optional[Account] = Relationship(back_populates="assets")
+
+class Job(SQLModel, table=True):
+    """Background generation jobs (profile, assets)"""
+    __tablename__ = "jobs"
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    account_id: int = Field(foreign_key="accounts.id", index=True)
+    kind: str  # profile, assets
+    status: str = "queued"  # queued, running, done, error
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = None
+    owner_pid: int = Field(default_factory=os.getpid)  # process whose in-memory queue holds it
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column(on_update=True))
 
 class Contact(SQLModel, table=True):
     """Contact persons (optional for MVP)"""
@@ -80,11 +190,39 @@ class Contact(SQLModel, table=True):
     title: Optional[str] = None
     email: Optional[str] = None
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=timestamp_column())
+
+def find_schema_problems(bind: Engine) -> List[str]:
+    """List columns, defaults and unique indexes the existing tables are missing"""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    problems = []
+    for table in SQLModel.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        columns = {column["name"]: column for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            existing = columns.get(column.name)
+            if existing is None:
+                problems.append(f"{table.name}.{column.name} is missing")
+            elif column.server_default is not None and existing.get("default") is None:
+                problems.append(f"{table.name}.{column.name} has no server default")
+        index_names = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.unique and index.name not in index_names:
+                problems.append(f"{table.name} is missing unique index {index.name}")
+    return problems
 
 def create_db_and_tables():
     """Initialize database and create all tables"""
     SQLModel.metadata.create_all(engine)
+    
+    problems = find_schema_problems(engine)
+    if problems:
+        raise RuntimeError(
+            "Database schema is out of date (" + "; ".join(problems) + "). "
+            "Delete app.db, or point DATABASE_URL at a new database, and restart."
+        )
 
 # Utility functions for database operations
 def get_session():
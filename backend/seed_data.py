@@ -7,6 +7,7 @@ Run: python seed_data.py
 import asyncio
 import requests
 import json
+import time
 from datetime import datetime
 
 API_BASE = "http://localhost:8000"
@@ -62,6 +63,18 @@ def create_prospect(company_data):
         print(f"❌ Error creating {company_data['company_name']}: {str(e)}")
         return None
 
+def wait_for_job(job_id, timeout=120):
+    """Poll a background generation job until it finishes"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        time.sleep(1)
+        job = requests.get(f"{API_BASE}/jobs/{job_id}", timeout=10).json()
+        if job["status"] == "done":
+            return job["result"]
+        if job["status"] == "error":
+            raise Exception(job["error"])
+    raise Exception(f"Job {job_id} timed out")
+
 def generate_profile(account_id, company_name):
     """Generate profile for account"""
     try:
@@ -72,8 +85,8 @@ def generate_profile(account_id, company_name):
             timeout=60
         )
         
-        if response.status_code == 200:
-            result = response.json()
+        if response.status_code == 202:
+            result = wait_for_job(response.json()['job_id'])
             coverage = result.get('provenance_coverage', 0)
             print(f"✅ Profile generated with {coverage:.0%} provenance coverage")
             return True
@@ -96,8 +109,8 @@ def generate_assets(account_id, company_name):
             timeout=60
         )
         
-        if response.status_code == 200:
-            result = response.json()
+        if response.status_code == 202:
+            result = wait_for_job(response.json()['job_id'])
             print(f"✅ Assets generated in {result['processing_time']:.1f}s")
             return True
         else:
@@ -3,24 +3,30 @@ Service classes for LLM, extraction, and asset generation
 Core business logic separated from API endpoints
 """
 
+import io
 import os
-import json
+import codecs
+import hashlib
+import asyncio
 import time
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Type, Union, BinaryIO
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from urllib.parse import urlparse
 import zipfile
-import shutil
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
 import openai
+import tiktoken
 import httpx
 from dotenv import load_dotenv
 from jinja2 import Environment, FileSystemLoader
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 import re
 
 from schemas import (
@@ -31,13 +37,47 @@ from models import Account, Source, Claim
 
 logger = logging.getLogger(__name__)
 
-# httpx 0.28 removed the ``proxies`` parameter from ``httpx.Client``. The
-# OpenAI SDK < 1.4 still passes this argument, which raises a ``TypeError``
-# when our environment ships with a newer httpx version.  To maintain
-# compatibility without downgrading httpx we provide a small wrapper class
-# that converts the deprecated ``proxies`` argument into the new ``proxy``
-# argument.  We monkeypatch OpenAI's internal reference so that client
-# initialization succeeds.
+# Generated assets go under the working directory; templates ship with the code
+ASSETS_DIR = Path("assets")
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+# Prompt context budgets in tokens. Profile sources share one budget that
+# also fits 8k-context models, with room for the instructions and output.
+SOURCE_CONTEXT_TOKENS = 4000
+TRANSCRIPT_TOKEN_LIMIT = 6000
+# Rough ratio used when the tokenizer can't be loaded, and to size reads
+CHARS_PER_TOKEN = 4
+
+# Email tone per target persona
+PERSONA_INSTRUCTIONS = {
+    "Exec": "Write for C-level executives. Focus on business impact, ROI, and strategic value.",
+    "Buyer": "Write for decision makers. Focus on solution benefits, competitive advantages.",
+    "Champion": "Write for internal advocates. Focus on technical benefits and team impact."
+}
+
+# Identical prompts reuse the stored completion for this long (0 disables)
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "3600"))
+LLM_CACHE_SIZE = 512
+
+# Completion output caps in tokens; profiles (many claims with quotes) need more
+LLM_MAX_TOKENS = 2000
+PROFILE_MAX_TOKENS = 8000
+
+# Profile model; older models reject json_schema response formats
+DEFAULT_PROFILE_MODEL = "gpt-4o"
+UNSTRUCTURED_MODEL_PREFIXES = ("gpt-3.5", "gpt-4-", "gpt-4o-2024-05-13")
+
+# Compiled once at import; used when cleaning up LLM JSON output
+_FENCE_RE = re.compile(r"^```(?:json)?\n")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# httpx 0.28 removed the ``proxies`` parameter from ``httpx.Client`` and
+# ``httpx.AsyncClient``. The OpenAI SDK < 1.4 still passes this argument,
+# which raises a ``TypeError`` when our environment ships with a newer httpx
+# version.  To maintain compatibility without downgrading httpx we provide
+# small wrapper classes that convert the deprecated ``proxies`` argument into
+# the new ``proxy`` argument.  We monkeypatch OpenAI's internal references so
+# that client initialization succeeds.
 if "proxies" not in httpx.Client.__init__.__code__.co_varnames:
     class _PatchedClient(httpx.Client):
         def __init__(self, *args, proxies=None, **kwargs):
@@ -45,106 +85,274 @@ if "proxies" not in httpx.Client.__init__.__code__.co_varnames:
                 kwargs["proxy"] = proxies
             super().__init__(*args, **kwargs)
 
+    class _PatchedAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args, proxies=None, **kwargs):
+            if proxies is not None and "proxy" not in kwargs:
+                kwargs["proxy"] = proxies
+            super().__init__(*args, **kwargs)
+
     openai._base_client.httpx.Client = _PatchedClient
+    openai._base_client.httpx.AsyncClient = _PatchedAsyncClient
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ``ttl`` seconds"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 
 class ExtractionService:
     """Service for extracting content from web pages"""
-    
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    FETCH_TIMEOUT = 10
+    # Connection caps for the shared session (total, and per target host)
+    FETCH_MAX_CONNECTIONS = 64
+    FETCH_MAX_PER_HOST = 8
+    # Only <title> and <body> are parsed; the rest of <head> is skipped
+    PARSE_ONLY = SoupStrainer(['title', 'body'])
+    # Extracted pages are reused for this long when the same URL is requested again
+    PAGE_CACHE_TTL = 3600
+    PAGE_CACHE_SIZE = 1024
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # title/text of recently extracted pages, keyed by normalized URL
+        self.page_cache = TTLCache(self.PAGE_CACHE_SIZE, self.PAGE_CACHE_TTL)
+
+    def create_http_session(self) -> aiohttp.ClientSession:
+        """Create the shared async HTTP session (call from a running event loop)"""
+        return aiohttp.ClientSession(
+            headers={'User-Agent': self.USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=self.FETCH_TIMEOUT),
+            connector=aiohttp.TCPConnector(
+                limit=self.FETCH_MAX_CONNECTIONS,
+                limit_per_host=self.FETCH_MAX_PER_HOST,
+                ttl_dns_cache=300
+            )
+        )
     
-    def extract_domain(self, url: str) -> str:
-        """Extract domain from URL"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def extract_domain(url: str) -> str:
+        """Extract domain from URL (memoized, repeat URLs skip parsing)"""
+        # "://" only marks a scheme if it holds the first slash in the URL
+        start = url.find('://')
+        if start >= 0 and url.find('/') == start + 1:
+            start += 3
+        elif url.startswith('//'):
+            # Scheme-relative ("//acme.com/x")
+            start = 2
+        else:
+            start = 0
+        end = len(url)
+        for delimiter in '/?#':
+            index = url.find(delimiter, start, end)
+            if index >= 0:
+                end = index
+        domain = url[start:end].lower()
+        # Remove www prefix
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return domain
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Add protocol if missing"""
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        return url
+
+    def _page_cache_key(self, url: str) -> str:
+        # example.com and https://example.com/ share an entry
+        return self.normalize_url(url).rstrip('/')
+
+    async def fetch_html(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Fetch raw HTML for URL over a shared aiohttp session"""
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            # Remove www prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            return domain
-        except Exception:
-            return url.split('/')[0] if '/' in url else url
+            async with session.get(self.normalize_url(url), allow_redirects=True) as response:
+                response.raise_for_status()
+                return await response.read()
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+            raise Exception(f"Failed to extract content: {str(e)}")
+
+    def parse_html(self, html: bytes) -> Dict[str, str]:
+        """Extract title and main content from raw HTML"""
+        soup = BeautifulSoup(html, 'lxml', parse_only=self.PARSE_ONLY)
+        
+        # Extract title
+        title = ""
+        if soup.title:
+            title = soup.title.get_text().strip()
+        
+        # Remove script and style elements (the strainer keeps all of <body>)
+        for element in soup(["script", "style", "nav", "footer", "header"]):
+            element.decompose()
+        
+        # Extract main content (simple approach)
+        main_content = soup.find('main') or soup.find('article') or soup.find('div', {'class': 'content'})
+        if not main_content:
+            main_content = soup.find('body')
+        
+        if main_content:
+            text = main_content.get_text()
+        else:
+            text = soup.get_text()
+        
+        # Collapse whitespace runs in one C-level split/join pass (str.split
+        # also covers Unicode whitespace such as the \xa0 from &nbsp;)
+        text = ' '.join(text.split())
+        
+        return {
+            "title": title,
+            "text": text
+        }
     
-    def extract_content(self, url: str) -> Dict[str, str]:
-        """Extract title and main content from URL"""
+    async def extract_content_batch(
+        self, session: aiohttp.ClientSession, urls: List[str]
+    ) -> List[Dict[str, str]]:
+        """Fetch and extract URLs concurrently, in input order (failures carry ``error``)"""
+        cached = [self.page_cache.get(self._page_cache_key(url)) for url in urls]
+        misses = [url for url, page in zip(urls, cached) if page is None]
+        
+        extracted = iter(await asyncio.gather(
+            *(self._extract_page(session, url) for url in misses)
+        ))
+        return [
+            {**page, "url": url} if page is not None else next(extracted)
+            for url, page in zip(urls, cached)
+        ]
+
+    async def _extract_page(self, session: aiohttp.ClientSession, url: str) -> Dict[str, str]:
         try:
-            # Add protocol if missing
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            
-            response = self.session.get(url, timeout=10, allow_redirects=True)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title = ""
-            if soup.title:
-                title = soup.title.get_text().strip()
-            
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
-            
-            # Extract main content (simple approach)
-            main_content = soup.find('main') or soup.find('article') or soup.find('div', {'class': 'content'})
-            if not main_content:
-                main_content = soup.find('body')
-            
-            if main_content:
-                text = main_content.get_text()
-            else:
-                text = soup.get_text()
-            
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
-            return {
-                "title": title,
-                "text": text,
-                "url": url
-            }
-            
+            html = await self.fetch_html(session, url)
         except Exception as e:
-            logger.error(f"Error extracting content from {url}: {str(e)}")
-            raise Exception(f"Failed to extract content: {str(e)}")
+            return {"url": url, "error": str(e)}
+        try:
+            content = await asyncio.to_thread(self.parse_html, html)
+        except Exception as e:
+            logger.error(f"Error parsing content from {url}: {str(e)}")
+            return {"url": url, "error": f"Failed to extract content: {str(e)}"}
+        self.page_cache.set(self._page_cache_key(url), content)
+        return {**content, "url": url}
 
 # --- LLM utilities -------------------------------------------------------
 
-COMPANY_PROFILE_FN = [{
-    "name": "company_profile",
-    "description": "Return a structured company profile with provenance.",
-    "parameters": {
-        "type": "object",
-        "properties": {
-            "company_name": {"type": "string"},
-            "industry": {"type": "string"},
-            "size_hint": {"type": "string"},
-            "products": {"type": "array", "items": {"type": "string"}},
-            "pain_points": {"type": "array", "items": {"type": "string"}},
-            "recent_events": {"type": "array", "items": {"type": "string"}},
-            "claims": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "text": {"type": "string"},
-                        "source_url": {"type": ["string", "null"]},
-                        "evidence_quote": {"type": ["string", "null"]},
-                        "confidence": {"type": "number"}
-                    },
-                    "required": ["text", "confidence"]
-                }
-            }
+def read_text_prefix(stream: BinaryIO, limit: int, chunk_size: int = 64 * 1024) -> str:
+    """Decode at least ``limit`` characters (or the whole stream) of UTF-8 text"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    size = 0
+    while size < limit:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            parts.append(decoder.decode(b"", final=True))
+            break
+        text = decoder.decode(chunk)
+        parts.append(text)
+        size += len(text)
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _token_encoding() -> Optional["tiktoken.Encoding"]:
+    """Load the tokenizer on first use (tiktoken downloads its BPE file once)"""
+    try:
+        # cl100k_base is the gpt-4 encoding; for gpt-4o it slightly overcounts
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, falling back to character limits: {e}")
+        return None
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens"""
+    encoding = _token_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def truncate_texts(texts: List[str], max_tokens: int) -> List[str]:
+    """Cut each of ``texts`` to at most ``max_tokens`` tokens"""
+    return [truncate_tokens(text, max_tokens) for text in texts]
+
+
+# JSON Schema keywords accepted by OpenAI strict structured outputs. Dropped
+# constraints (lengths, item counts, formats) are still enforced by pydantic.
+_STRICT_SCHEMA_KEYS = {
+    "type", "properties", "items", "required", "anyOf", "enum",
+    "description", "additionalProperties", "$ref", "$defs",
+}
+
+
+def strict_json_schema(schema: Any) -> Any:
+    """Reduce a pydantic JSON schema to the subset strict structured outputs accept"""
+    if isinstance(schema, list):
+        return [strict_json_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    if "$ref" in schema:
+        return {"$ref": schema["$ref"]}
+
+    strict = {}
+    for key, value in schema.items():
+        if key not in _STRICT_SCHEMA_KEYS:
+            continue
+        if key in ("properties", "$defs"):
+            strict[key] = {name: strict_json_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = strict_json_schema(value)
+
+    if strict.get("type") == "object":
+        strict["additionalProperties"] = False
+        strict["required"] = list(strict.get("properties", {}))
+    return strict
+
+
+@lru_cache(maxsize=None)
+def response_format_for(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAI ``response_format`` that constrains output to ``model``'s schema"""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": strict_json_schema(model.model_json_schema()),
+            "strict": True,
         },
-        "required": ["company_name", "claims"]
     }
-}]
+
+
+class LLMOutputTruncated(Exception):
+    """Completion stopped at max_tokens, so its JSON is incomplete"""
 
 
 class LLMService:
@@ -157,121 +365,87 @@ class LLMService:
         api_key = os.getenv("OPENAI_API_KEY")
         base_url = os.getenv("OPENAI_API_BASE")
 
-        self.client = openai.OpenAI(
+        # Async client so LLM calls never block the event loop
+        self.client = openai.AsyncOpenAI(
             api_key=api_key,
             base_url=base_url if base_url else None,
         )
 
         if not api_key:
             logger.warning("OPENAI_API_KEY not set - LLM features will not work")
+
+        self.profile_model = os.getenv("OPENAI_MODEL", DEFAULT_PROFILE_MODEL)
+        if (
+            self.profile_model == "gpt-4"
+            or self.profile_model.startswith(UNSTRUCTURED_MODEL_PREFIXES)
+        ):
+            logger.warning(
+                f"OPENAI_MODEL={self.profile_model} does not support structured outputs; "
+                f"using {DEFAULT_PROFILE_MODEL} for profiles"
+            )
+            self.profile_model = DEFAULT_PROFILE_MODEL
+
+        # Completions keyed by sha256 of (method tag, prompt)
+        self.response_cache = TTLCache(LLM_CACHE_SIZE, LLM_CACHE_TTL)
+
+        # Prompt templates, compiled once (plain text, so no HTML escaping)
+        self.prompt_env = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR / "prompts"),
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            keep_trailing_newline=True
+        )
+        self.profile_prompt = self.prompt_env.get_template("profile.j2")
+        self.email_prompt = self.prompt_env.get_template("email.j2")
+        self.pitch_prompt = self.prompt_env.get_template("pitch.j2")
+        self.meeting_prompt = self.prompt_env.get_template("meeting.j2")
     
     async def generate_profile(self, account: Account, sources: List[Source]) -> CompanyProfile:
         """Generate company profile with provenance from sources"""
 
-        # Prepare source context for the prompt
-        source_context = ""
-        for i, source in enumerate(sources, 1):
-            source_context += f"\n--- Source {i}: {source.url} ---\n"
-            source_context += f"Title: {source.title}\n"
-            source_context += f"Content: {source.raw_text[:2000]}\n"  # Limit per source
-
-        system_prompt = (
-            "You are a B2B sales researcher. Only respond via the provided function call."
-        )
-        user_prompt = (
-            "Build a company profile from these sources. If a claim has no source, set "
-            "source_url to null and confidence <= 0.3.\n\n" + source_context
+        # Split the source token budget evenly across sources. Tokenizing (and
+        # tiktoken's one-time BPE download) runs off the event loop.
+        tokens_per_source = SOURCE_CONTEXT_TOKENS // max(len(sources), 1)
+        contents = await asyncio.to_thread(
+            truncate_texts, [source.raw_text for source in sources], tokens_per_source
         )
 
-        for attempt in range(3):
-            try:
-                rsp = self.client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4-0613"),
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    functions=COMPANY_PROFILE_FN,
-                    function_call={"name": "company_profile"},
-                    temperature=0.2,
-                )
-                msg = rsp.choices[0].message
-                args = getattr(msg, "function_call", None)
-                if args:
-                    arg_str = args.arguments
-                    try:
-                        return self._parse_profile_json(arg_str)
-                    except (json.JSONDecodeError, ValidationError) as e:
-                        logger.debug(
-                            "Parse/validation error: %s | raw: %s",
-                            e,
-                            arg_str[:400],
-                        )
-                        continue
-                # Rare fallbacks where no function_call returned
-                if msg.content:
-                    try:
-                        return self._parse_profile_json(msg.content)
-                    except Exception as e:
-                        logger.debug(
-                            "Failed to parse content: %s | raw: %s",
-                            e,
-                            msg.content[:400],
-                        )
-            except Exception as e:
-                logger.warning(f"LLM call failed on attempt {attempt+1}: {e}")
-                time.sleep(1)
-                continue
-
-        raise Exception("LLM returned invalid JSON after retries")
+        user_prompt = self.profile_prompt.render(sources=[
+            {
+                "url": source.url,
+                "title": source.title,
+                "content": content
+            }
+            for source, content in zip(sources, contents)
+        ])
+
+        # Strict schema output always parses; retries cover API errors only
+        response = await self._call_llm(
+            user_prompt,
+            max_retries=2,
+            cache_tag="profile",
+            schema=CompanyProfile,
+            model=self.profile_model,
+            temperature=0.2,
+            max_tokens=PROFILE_MAX_TOKENS
+        )
+        return self._parse_profile_json(response)
     
     async def generate_email(self, account: Account, claims: List[Claim], persona: str) -> EmailDraft:
         """Generate personalized email draft"""
         
-        # Prepare context from claims
-        context = f"Company: {account.name}\n"
-        context += f"Industry: {account.industry or 'Unknown'}\n"
-        context += f"Size: {account.size_hint or 'Unknown'}\n\n"
-        
-        context += "Key insights:\n"
-        for claim in claims[:5]:  # Use top 5 claims
-            if claim.confidence > 0.5:
-                context += f"- {claim.text}\n"
-        
-        persona_instructions = {
-            "Exec": "Write for C-level executives. Focus on business impact, ROI, and strategic value.",
-            "Buyer": "Write for decision makers. Focus on solution benefits, competitive advantages.",
-            "Champion": "Write for internal advocates. Focus on technical benefits and team impact."
-        }
-        
-        prompt = f"""
-Write a personalized sales email for {persona} persona.
-
-{persona_instructions.get(persona, "")}
-
-Context:
-{context}
-
-Requirements:
-- Subject line that captures attention
-- Body: 120-180 words maximum
-- Professional but conversational tone
-- One clear call-to-action
-- Reference specific company insights
-- No placeholder text or brackets
-
-Return JSON format:
-{{
-  "persona": "{persona}",
-  "subject": "Compelling subject line",
-  "body": "Email body content (120-180 words)",
-  "cta": "Specific call to action"
-}}
-"""
+        # Use the top 5 claims
+        prompt = self.email_prompt.render(
+            account=account,
+            claims=[claim for claim in claims[:5] if claim.confidence > 0.5],
+            persona=persona,
+            persona_instructions=PERSONA_INSTRUCTIONS.get(persona, "")
+        )
         
         try:
-            response = await self._call_llm(prompt)
-            email_data = json.loads(response)
+            response = await self._call_llm(prompt, cache_tag="email", schema=EmailDraft)
+            email_data = self._parse_json(response)
             return EmailDraft(**email_data)
         except Exception as e:
             logger.error(f"Error generating email: {e}")
@@ -280,49 +454,15 @@ Return JSON format:
     async def generate_pitch(self, account: Account, claims: List[Claim]) -> PitchOutline:
         """Generate pitch outline with objections"""
         
-        context = f"Company: {account.name}\n"
-        context += f"Industry: {account.industry or 'Unknown'}\n"
-        
-        context += "Key insights:\n"
-        for claim in claims[:8]:  # Use top claims
-            if claim.confidence > 0.5:
-                context += f"- {claim.text}\n"
-        
-        prompt = f"""
-Create a sales pitch outline for this prospect:
-
-{context}
-
-Generate exactly 6-8 agenda points and exactly 2 objections with responses.
-
-Return JSON format:
-{{
-  "agenda": [
-    "Opening & rapport building",
-    "Discovery of current challenges",
-    "Solution overview tailored to {account.name}",
-    "ROI and business case",
-    "Implementation approach",
-    "Next steps and timeline",
-    "Q&A and objection handling",
-    "Commitment and follow-up"
-  ],
-  "objections": [
-    {{
-      "objection": "Common objection like budget/timing/priority",
-      "response": "Specific response addressing their situation"
-    }},
-    {{
-      "objection": "Technical or integration concern",
-      "response": "Detailed response with proof points"
-    }}
-  ]
-}}
-"""
+        # Use top claims
+        prompt = self.pitch_prompt.render(
+            account=account,
+            claims=[claim for claim in claims[:8] if claim.confidence > 0.5]
+        )
         
         try:
-            response = await self._call_llm(prompt)
-            pitch_data = json.loads(response)
+            response = await self._call_llm(prompt, cache_tag="pitch", schema=PitchOutline)
+            pitch_data = self._parse_json(response)
             
             objections = [PitchObjection(**obj) for obj in pitch_data["objections"]]
             
@@ -334,34 +474,26 @@ Return JSON format:
             logger.error(f"Error generating pitch: {e}")
             raise Exception(f"Pitch generation failed: {str(e)}")
     
-    async def generate_meeting_summary(self, transcript: str) -> MeetingSummary:
-        """Generate meeting summary from transcript"""
+    async def generate_meeting_summary(self, transcript: Union[str, BinaryIO]) -> MeetingSummary:
+        """Generate meeting summary from transcript text or a binary file object"""
+        if not isinstance(transcript, str):
+            # Stream-decode only the part of the file the prompt can use
+            # (generously sized, since tokens average ~4 characters), in a
+            # thread since spooled uploads over the memory limit live on disk
+            transcript = await asyncio.to_thread(
+                read_text_prefix, transcript, TRANSCRIPT_TOKEN_LIMIT * CHARS_PER_TOKEN * 2
+            )
         
-        prompt = f"""
-Analyze this meeting transcript and extract key information:
-
-{transcript[:8000]}  # Limit transcript size
-
-Return JSON format:
-{{
-  "summary": "High-level summary of the meeting",
-  "next_steps": [
-    {{
-      "owner": "Person responsible",
-      "task": "Specific task description",
-      "due_date": "YYYY-MM-DD or null"
-    }}
-  ],
-  "blockers": ["Identified blocker or concern"],
-  "objections": ["Objection raised during meeting"]
-}}
-
-Focus on actionable items and explicit concerns mentioned.
-"""
+        transcript = await asyncio.to_thread(
+            truncate_tokens, transcript, TRANSCRIPT_TOKEN_LIMIT
+        )
+        prompt = self.meeting_prompt.render(transcript=transcript)
         
         try:
-            response = await self._call_llm(prompt)
-            summary_data = json.loads(response)
+            response = await self._call_llm(
+                prompt, cache_tag="meeting_summary", schema=MeetingSummary
+            )
+            summary_data = self._parse_json(response)
             
             next_steps = [NextStep(**step) for step in summary_data.get("next_steps", [])]
             
@@ -375,216 +507,103 @@ Focus on actionable items and explicit concerns mentioned.
             logger.error(f"Error generating meeting summary: {e}")
             raise Exception(f"Meeting summary failed: {str(e)}")
     
-    async def _call_llm(self, prompt: str, max_retries: int = 1) -> str:
-        """Make LLM API call with retries"""
+    async def _call_llm(
+        self,
+        prompt: str,
+        max_retries: int = 1,
+        cache_tag: str = "",
+        schema: Optional[Type[BaseModel]] = None,
+        model: str = "gpt-4o",
+        temperature: float = 0.3,
+        max_tokens: int = LLM_MAX_TOKENS
+    ) -> str:
+        """Make LLM API call with retries, reusing cached completions for identical prompts"""
+        cache_key = self._cache_key(cache_tag, prompt)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         for attempt in range(max_retries + 1):
             try:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o",
+                # Stream the completion so tokens are consumed as they arrive
+                stream = await self.client.chat.completions.create(
+                    model=model,
                     messages=[
                         {"role": "system", "content": "You are a B2B sales research assistant. Always return valid JSON."},
                         {"role": "user", "content": prompt}
                     ],
-                    temperature=0.3,
-                    max_tokens=2000
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=(
+                        response_format_for(schema) if schema
+                        else {"type": "json_object"}
+                    ),
+                    stream=True
                 )
-                return response.choices[0].message.content
+                parts = []
+                finish_reason = None
+                async for chunk in stream:
+                    if chunk.choices:
+                        choice = chunk.choices[0]
+                        if choice.delta.content:
+                            parts.append(choice.delta.content)
+                        finish_reason = choice.finish_reason or finish_reason
+                if finish_reason == "length":
+                    raise LLMOutputTruncated(
+                        f"LLM output hit the {max_tokens}-token limit before the JSON was complete"
+                    )
+                content = ''.join(parts)
+                self._cache_response(cache_key, content, schema)
+                return content
+            except LLMOutputTruncated:
+                # Same prompt, same limit: a retry would be cut off again
+                raise
             except Exception as e:
                 if attempt < max_retries:
                     logger.warning(f"LLM call failed, retrying: {e}")
-                    time.sleep(1)
+                    await asyncio.sleep(2 ** attempt)
                     continue
                 raise e
 
-    def _parse_profile_json(self, text: str) -> CompanyProfile:
-        """Parse raw LLM text into a CompanyProfile object"""
+    @staticmethod
+    def _cache_key(cache_tag: str, prompt: str) -> str:
+        # The tag keeps entries from different generators apart
+        return hashlib.sha256(f"{cache_tag}\0{prompt}".encode()).hexdigest()
+
+    def _cache_response(
+        self, cache_key: str, content: str, schema: Optional[Type[BaseModel]] = None
+    ) -> None:
+        """Cache a completion only if it parses and validates, so bad output is retried"""
+        try:
+            data = self._parse_json(content)
+            if schema:
+                schema.model_validate(data)
+        except (orjson.JSONDecodeError, ValidationError):
+            return
+        self.response_cache.set(cache_key, content)
+
+    def _parse_json(self, text: str) -> Dict[str, Any]:
+        """Parse raw LLM text as a JSON object, tolerating fences and surrounding prose"""
         cleaned = text.strip()
         if cleaned.startswith("```"):
             # remove markdown fences
-            cleaned = re.sub(r"^```(?:json)?\n", "", cleaned)
-            cleaned = cleaned.rstrip("`")
+            cleaned = _FENCE_RE.sub("", cleaned).rstrip("`").strip()
 
-        if not cleaned.lstrip().startswith("{"):
-            match = re.search(r"\{.*\}", cleaned, re.DOTALL)
-            if match:
-                cleaned = match.group(0)
-
-        data = json.loads(cleaned)
-        return CompanyProfile.model_validate(data)
-
-class AssetService:
-    """Service for generating and managing asset files"""
-    
-    def __init__(self):
-        self.assets_dir = Path("assets")
-        self.templates_dir = Path("templates")
-        
-        # Initialize Jinja2 environment
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.templates_dir),
-            autoescape=True
-        )
-    
-    def create_email_file(self, account_id: int, email: EmailDraft) -> str:
-        """Create email draft file"""
-        account_dir = self.assets_dir / f"account_{account_id}"
-        account_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_path = account_dir / f"email_draft_{int(time.time())}.txt"
-        
-        content = f"""Subject: {email.subject}
-
-{email.body}
-
----
-Call to Action: {email.cta}
-Persona: {email.persona}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        file_path.write_text(content)
-        return str(file_path)
-    
-    def create_pitch_file(self, account_id: int, pitch: PitchOutline) -> str:
-        """Create pitch outline markdown file"""
-        account_dir = self.assets_dir / f"account_{account_id}"
-        account_dir.mkdir(parents=True, exist_ok=True)
-        
-        file_path = account_dir / f"pitch_outline_{int(time.time())}.md"
-        
-        content = f"""# Sales Pitch Outline
-
-## Agenda
-
-"""
-        for i, item in enumerate(pitch.agenda, 1):
-            content += f"{i}. {item}\n"
-        
-        content += f"""
-
-## Objection Handling
+        try:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError:
+            # Fall back to the outermost {...} block
+            match = _JSON_OBJECT_RE.search(cleaned)
+            if not match:
+                raise
+            return orjson.loads(match.group(0))
 
-"""
-        for obj in pitch.objections:
-            content += f"""
-**Objection:** {obj.objection}
-**Response:** {obj.response}
+    def _parse_profile_json(self, text: str) -> CompanyProfile:
+        """Parse raw LLM text into a CompanyProfile object"""
+        return CompanyProfile.model_validate(self._parse_json(text))
 
-"""
-        
-        content += f"""
----
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        
-        file_path.write_text(content)
-        return str(file_path)
-    
-    def create_landing_page(self, account: Account, claims: List[Claim], email: EmailDraft) -> str:
-        """Create landing page HTML/CSS zip file"""
-        account_dir = self.assets_dir / f"account_{account_id}"
-        account_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create temporary directory for landing page files
-        temp_dir = account_dir / f"landing_temp_{int(time.time())}"
-        temp_dir.mkdir()
-        
-        # Get high-confidence claims for proof points
-        proof_claims = [c for c in claims if c.confidence > 0.7][:3]
-        
-        # Generate HTML
-        html_content = self._generate_landing_html(account, proof_claims, email)
-        (temp_dir / "index.html").write_text(html_content)
-        
-        # Generate CSS
-        css_content = self._generate_landing_css()
-        (temp_dir / "styles.css").write_text(css_content)
-        
-        # Create zip file
-        zip_path = account_dir / f"landing_page_{int(time.time())}.zip"
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            for file_path in temp_dir.iterdir():
-                zipf.write(file_path, file_path.name)
-        
-        # Clean up temp directory
-        shutil.rmtree(temp_dir)
-        
-        return str(zip_path)
-    
-    def _generate_landing_html(self, account: Account, claims: List[Claim], email: EmailDraft) -> str:
-        """Generate landing page HTML"""
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Solutions for {account.name}</title>
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>Tailored Solutions for {account.name}</h1>
-            <p class="subheader">Accelerate your growth with our proven platform</p>
-        </header>
-        
-        <main>
-            <section class="value-props">
-                <h2>Why leading {account.industry or 'companies'} choose us</h2>
-                <div class="benefits">
-                    <div class="benefit">
-                        <h3>🚀 Rapid Implementation</h3>
-                        <p>Deploy in weeks, not months, with our battle-tested platform</p>
-                    </div>
-                    <div class="benefit">
-                        <h3>📈 Measurable ROI</h3>
-                        <p>See immediate impact with comprehensive analytics and reporting</p>
-                    </div>
-                    <div class="benefit">
-                        <h3>🔧 Seamless Integration</h3>
-                        <p>Works with your existing tools and workflows</p>
-                    </div>
-                </div>
-            </section>
-            
-            {self._generate_proof_section(claims)}
-            
-            <section class="cta-section">
-                <h2>Ready to transform your operations?</h2>
-                <p>Join {account.name} and hundreds of other industry leaders</p>
-                <button class="cta-button">{email.cta}</button>
-                <p class="cta-note">Book a personalized demo to see how we can help {account.name}</p>
-            </section>
-        </main>
-        
-        <footer>
-            <p>Generated for {account.name} • {datetime.now().strftime('%B %Y')}</p>
-        </footer>
-    </div>
-</body>
-</html>"""
-    
-    def _generate_proof_section(self, claims: List[Claim]) -> str:
-        """Generate proof points section"""
-        if not claims:
-            return ""
-        
-        section = '<section class="proof-section">\n<h2>Built for companies like yours</h2>\n<div class="proof-points">\n'
-        
-        for claim in claims[:3]:
-            section += f'''
-                <div class="proof-point">
-                    <p>"{claim.text}"</p>
-                    {f'<cite>Source: {claim.source_url}</cite>' if claim.source_url else ''}
-                </div>
-            '''
-        
-        section += '</div>\n</section>'
-        return section
-    
-    def _generate_landing_css(self) -> str:
-        """Generate landing page CSS"""
-        return """
+# Stylesheet shipped with every landing page zip (static, built once)
+_LANDING_CSS = """
 * {
     margin: 0;
     padding: 0;
@@ -741,4 +760,137 @@ footer {
         grid-template-columns: 1fr;
     }
 }
-"""
\ No newline at end of file
+"""
+
+class AssetService:
+    """Service for generating and managing asset files"""
+    
+    def __init__(self):
+        self.assets_dir = ASSETS_DIR
+        self.templates_dir = TEMPLATES_DIR
+        
+        # Initialize Jinja2 environment
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(self.templates_dir),
+            autoescape=True
+        )
+        # Compiled once; rendered per landing page
+        self.landing_template = self.jinja_env.get_template("landing.html")
+        
+        # Accounts whose asset directory this process has already created
+        self._account_dirs = set()
+    
+    def _write_asset(self, account_id: int, filename: str, content: bytes) -> str:
+        """Write an asset file into the account's directory and return its path"""
+        account_dir = self.assets_dir / f"account_{account_id}"
+        if account_id not in self._account_dirs:
+            account_dir.mkdir(parents=True, exist_ok=True)
+            self._account_dirs.add(account_id)
+        
+        # Raw bytes skip the text IO layer; callers encode once
+        file_path = account_dir / filename
+        try:
+            file_path.write_bytes(content)
+        except FileNotFoundError:
+            # Directory was removed since (account deleted); recreate it
+            account_dir.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(content)
+        return str(file_path)
+    
+    @staticmethod
+    def _clock() -> Tuple[int, datetime]:
+        """One clock read: nanoseconds for the file name, local time for display"""
+        now_ns = time.time_ns()
+        return now_ns, datetime.fromtimestamp(now_ns / 1e9)
+    
+    def create_email_file(self, account_id: int, email: EmailDraft) -> str:
+        """Create email draft file"""
+        now_ns, now = self._clock()
+        content = f"""Subject: {email.subject}
+
+{email.body}
+
+---
+Call to Action: {email.cta}
+Persona: {email.persona}
+Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
+"""
+        
+        # Nanosecond names so back-to-back generations never overwrite each other
+        return self._write_asset(
+            account_id, f"email_draft_{now_ns}.txt", content.encode("utf-8")
+        )
+    
+    def create_pitch_file(self, account_id: int, pitch: PitchOutline) -> str:
+        """Create pitch outline markdown file"""
+        now_ns, now = self._clock()
+        parts = ["# Sales Pitch Outline\n\n## Agenda\n\n"]
+        parts.extend(f"{i}. {item}\n" for i, item in enumerate(pitch.agenda, 1))
+        parts.append("\n\n## Objection Handling\n\n")
+        parts.extend(
+            f"\n**Objection:** {obj.objection}\n**Response:** {obj.response}\n\n"
+            for obj in pitch.objections
+        )
+        parts.append(f"\n---\nGenerated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        content = "".join(parts).encode("utf-8")
+        
+        return self._write_asset(account_id, f"pitch_outline_{now_ns}.md", content)
+    
+    def create_landing_page(
+        self, account: Dict[str, Any], claims: List[Dict[str, Any]], email: EmailDraft
+    ) -> str:
+        """Create landing page HTML/CSS zip file from plain account/claim dicts"""
+        now_ns, now = self._clock()
+        
+        # Get high-confidence claims for proof points
+        proof_claims = [c for c in claims if c["confidence"] > 0.7][:3]
+        
+        # Generate HTML and CSS
+        html_content = self._generate_landing_html(account, proof_claims, email, now)
+        css_content = self._generate_landing_css()
+        
+        # Build both files into a compressed zip in memory (no temp files)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+            zipf.writestr("index.html", html_content)
+            zipf.writestr("styles.css", css_content)
+        
+        return self._write_asset(
+            account["id"], f"landing_page_{now_ns}.zip", buffer.getvalue()
+        )
+    
+    def _generate_landing_html(
+        self,
+        account: Dict[str, Any],
+        claims: List[Dict[str, Any]],
+        email: EmailDraft,
+        now: datetime
+    ) -> str:
+        """Generate landing page HTML"""
+        return self.landing_template.render(
+            account=account, claims=claims, email=email, now=now
+        )
+    
+    def _generate_landing_css(self) -> str:
+        """Generate landing page CSS"""
+        return _LANDING_CSS
+
+# Shared service instances, built on first use (once per process)
+
+@lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    return LLMService()
+
+@lru_cache(maxsize=1)
+def get_extraction_service() -> ExtractionService:
+    return ExtractionService()
+
+@lru_cache(maxsize=1)
+def get_asset_service() -> AssetService:
+    return AssetService()
+
+def build_landing_page(
+    account: Dict[str, Any], claims: List[Dict[str, Any]], email: EmailDraft
+) -> str:
+    """Process-pool entry point for AssetService.create_landing_page"""
+    return get_asset_service().create_landing_page(account, claims, email)
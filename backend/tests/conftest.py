@@ -0,0 +1,38 @@
+import pytest
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+from models import JSON_ENGINE_ARGS
+
+
+@pytest.fixture
+def main_module(tmp_path, monkeypatch):
+    # main mounts these directories relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "static").mkdir()
+    (tmp_path / "assets").mkdir()
+    import main
+    return main
+
+
+@pytest.fixture
+def engine(request, tmp_path):
+    # In-memory by default; parametrize indirectly with "file" when several
+    # threads need their own connections
+    if getattr(request, "param", "memory") == "file":
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'test.db'}",
+            connect_args={"check_same_thread": False},
+            **JSON_ENGINE_ARGS
+        )
+    else:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            **JSON_ENGINE_ARGS
+        )
+    SQLModel.metadata.create_all(engine)
+    return engine
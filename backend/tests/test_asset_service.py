@@ -0,0 +1,50 @@
+import pytest
+import sys, os, shutil, zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+from services import AssetService, build_landing_page
+from models import Account, Claim
+from schemas import EmailDraft
+
+
+def test_asset_files_survive_account_dir_removal(tmp_path):
+    assets = AssetService()
+    assets.assets_dir = tmp_path
+    email = EmailDraft(persona="Exec", subject="Hi", body="Hello there", cta="Call")
+
+    first = assets.create_email_file(1, email)
+    # delete_account removes the directory behind the service's back
+    shutil.rmtree(tmp_path / "account_1")
+    second = assets.create_email_file(1, email)
+
+    assert first != second
+    assert "Subject: Hi" in open(second).read()
+
+
+def test_build_landing_page_in_process_pool(tmp_path, monkeypatch):
+    # Workers write assets/ under the working directory
+    monkeypatch.chdir(tmp_path)
+    account = Account(id=7, name="Acme", domain="acme.com", industry="Manufacturing")
+    claims = [
+        Claim(account_id=7, text="Ships widgets worldwide", confidence=0.9),
+        Claim(account_id=7, text="Maybe hiring", confidence=0.2),
+    ]
+    email = EmailDraft(persona="Exec", subject="Hi", body="Hello there", cta="Book a call")
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        path = pool.submit(
+            build_landing_page,
+            account.model_dump(),
+            [claim.model_dump() for claim in claims],
+            email
+        ).result(timeout=30)
+
+    assert Path(path).parent == Path("assets/account_7")
+    with zipfile.ZipFile(path) as zipf:
+        assert sorted(zipf.namelist()) == ["index.html", "styles.css"]
+        html = zipf.read("index.html").decode()
+    assert "Acme" in html
+    assert "Ships widgets worldwide" in html
+    assert "Maybe hiring" not in html
@@ -0,0 +1,142 @@
+import pytest
+import sys, os, time
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+from models import Account, Claim, Job, Source
+
+# Job workers and request handlers run on separate threads and connections
+pytestmark = pytest.mark.parametrize("engine", ["file"], indirect=True)
+
+
+@pytest.fixture
+def main_module(main_module, monkeypatch, engine):
+    monkeypatch.setattr(main_module, "engine", engine)
+    monkeypatch.setattr(main_module, "create_db_and_tables", lambda: None)
+    return main_module
+
+
+@pytest.fixture
+def client(main_module):
+    with TestClient(main_module.app) as client:
+        yield client
+
+
+def seed_account(engine, with_sources=True, with_claims=True):
+    with Session(engine) as session:
+        account = Account(name="Acme", domain="acme.com")
+        if with_sources:
+            account.sources = [Source(url="https://acme.com", status="success")]
+        if with_claims:
+            account.claims = [Claim(text="Makes widgets", confidence=0.9)]
+        session.add(account)
+        session.commit()
+        return account.id
+
+
+def wait_for_job(client, job_id):
+    for _ in range(100):
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] in ("done", "error"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_profile_job_runs_to_done(main_module, engine, client, monkeypatch):
+    account_id = seed_account(engine)
+
+    async def fake_profile_job(account_id):
+        return {"account_id": account_id, "claims_count": 1}
+
+    monkeypatch.setitem(main_module.JOB_HANDLERS, "profile", fake_profile_job)
+    response = client.post(f"/accounts/{account_id}/generate_profile")
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+
+    job = wait_for_job(client, response.json()["job_id"])
+    assert job["status"] == "done"
+    assert job["result"] == {"account_id": account_id, "claims_count": 1}
+    assert job["owner_pid"] == os.getpid()
+
+
+def test_assets_job_records_error(main_module, engine, client, monkeypatch):
+    account_id = seed_account(engine)
+    personas = []
+
+    async def failing_assets_job(account_id, persona):
+        personas.append(persona)
+        raise HTTPException(status_code=400, detail="No profile data found")
+
+    monkeypatch.setitem(main_module.JOB_HANDLERS, "assets", failing_assets_job)
+    response = client.post(f"/accounts/{account_id}/generate_assets", json={"persona": "Buyer"})
+    assert response.status_code == 202
+
+    job = wait_for_job(client, response.json()["job_id"])
+    assert job["status"] == "error"
+    assert job["error"] == "No profile data found"
+    assert personas == ["Buyer"]
+
+
+def test_generate_endpoints_validate_before_queueing(engine, client):
+    assert client.post("/accounts/999/generate_profile").status_code == 404
+    assert client.post("/accounts/999/generate_assets", json={"persona": "Exec"}).status_code == 404
+
+    account_id = seed_account(engine, with_sources=False, with_claims=False)
+    assert client.post(f"/accounts/{account_id}/generate_profile").status_code == 400
+    response = client.post(f"/accounts/{account_id}/generate_assets", json={"persona": "Exec"})
+    assert response.status_code == 400
+
+    assert client.get("/jobs/999").status_code == 404
+    with Session(engine) as session:
+        assert session.exec(select(Job)).all() == []
+
+
+def test_restart_fails_only_jobs_of_exited_processes(main_module, engine):
+    account_id = seed_account(engine)
+    with Session(engine) as session:
+        session.add_all([
+            # Same pid as this (just started) process: left over from a predecessor
+            Job(account_id=account_id, kind="profile", status="running", owner_pid=os.getpid()),
+            # A sibling worker that is still alive
+            Job(account_id=account_id, kind="profile", status="running", owner_pid=os.getppid()),
+        ])
+        session.commit()
+
+    main_module._fail_interrupted_jobs()
+
+    with Session(engine) as session:
+        stale, sibling = session.exec(select(Job).order_by(Job.id)).all()
+    assert stale.status == "error"
+    assert sibling.status == "running"
+
+
+def test_worker_survives_failure_to_record_job_error(main_module, engine, monkeypatch):
+    account_id = seed_account(engine)
+    update_job = main_module._update_job
+    failing_job_ids = []
+
+    def flaky_update_job(job_id, **fields):
+        # Every write for the first job fails, including recording its error
+        if not failing_job_ids:
+            failing_job_ids.append(job_id)
+        if job_id == failing_job_ids[0]:
+            raise RuntimeError("database is locked")
+        update_job(job_id, **fields)
+
+    async def fake_profile_job(account_id):
+        return {"claims_count": 1}
+
+    # A single worker, so a dead worker would leave the next job queued
+    monkeypatch.setattr(main_module, "JOB_WORKERS", 1)
+    monkeypatch.setattr(main_module, "_update_job", flaky_update_job)
+    monkeypatch.setitem(main_module.JOB_HANDLERS, "profile", fake_profile_job)
+
+    with TestClient(main_module.app) as client:
+        first = client.post(f"/accounts/{account_id}/generate_profile").json()["job_id"]
+        second = client.post(f"/accounts/{account_id}/generate_profile").json()["job_id"]
+
+        assert wait_for_job(client, second)["status"] == "done"
+    assert failing_job_ids == [first]
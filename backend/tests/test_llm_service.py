@@ -0,0 +1,151 @@
+import pytest
+import sys, os, io, asyncio, threading
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+import services
+from services import LLMService, LLMOutputTruncated, CompanyProfile, PROFILE_MAX_TOKENS
+from models import Account, Source
+
+
+class _FakeCompletions:
+    def __init__(self, content, finish_reason="stop"):
+        self.content = content
+        self.finish_reason = finish_reason
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.kwargs = kwargs
+        return self._stream()
+
+    async def _stream(self):
+        # Deliver the completion in small streamed deltas
+        for i in range(0, len(self.content), 4):
+            yield self._chunk(self.content[i:i + 4], None)
+        yield self._chunk(None, self.finish_reason)
+
+    @staticmethod
+    def _chunk(content, finish_reason):
+        delta = type("Delta", (), {"content": content})
+        choice = type("Choice", (), {"delta": delta, "finish_reason": finish_reason})
+        return type("Chunk", (), {"choices": [choice]})
+
+
+def record_tokenizer_threads(monkeypatch):
+    threads = []
+
+    def fake_encoding():
+        threads.append(threading.current_thread())
+        return None
+
+    monkeypatch.setattr(services, "_token_encoding", fake_encoding)
+    return threads
+
+
+def test_meeting_summary_tokenizes_off_event_loop(monkeypatch):
+    threads = record_tokenizer_threads(monkeypatch)
+    service = LLMService()
+
+    async def fake_call_llm(prompt, **kwargs):
+        return '{"summary": "ok", "next_steps": [], "blockers": [], "objections": []}'
+
+    monkeypatch.setattr(service, "_call_llm", fake_call_llm)
+    summary = asyncio.run(service.generate_meeting_summary("hello transcript"))
+    assert summary.summary == "ok"
+    assert threads and threading.main_thread() not in threads
+
+
+class _ThreadRecordingFile(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.threads = []
+
+    def read(self, size=-1):
+        self.threads.append(threading.current_thread())
+        return super().read(size)
+
+
+def test_meeting_summary_reads_upload_off_event_loop(monkeypatch):
+    record_tokenizer_threads(monkeypatch)
+    service = LLMService()
+    prompts = []
+
+    async def fake_call_llm(prompt, **kwargs):
+        prompts.append(prompt)
+        return '{"summary": "ok", "next_steps": [], "blockers": [], "objections": []}'
+
+    monkeypatch.setattr(service, "_call_llm", fake_call_llm)
+    upload = _ThreadRecordingFile("héllo transcript".encode("utf-8"))
+    asyncio.run(service.generate_meeting_summary(upload))
+    assert "héllo transcript" in prompts[0]
+    assert upload.threads and threading.main_thread() not in upload.threads
+
+
+def test_generate_profile_caches_identical_sources(monkeypatch):
+    record_tokenizer_threads(monkeypatch)
+    service = LLMService()
+    completions = _FakeCompletions(
+        '{"company_name": "Acme", "claims": [{"text": "Makes widgets", "confidence": 0.9}]}'
+    )
+    monkeypatch.setattr(service.client.chat, "completions", completions)
+    account = Account(name="Acme", domain="acme.com")
+    sources = [Source(url="https://acme.com", title="Acme", raw_text="Acme makes widgets")]
+
+    for _ in range(2):
+        profile = asyncio.run(service.generate_profile(account, sources))
+        assert profile.claims[0].text == "Makes widgets"
+    assert completions.calls == 1
+    assert completions.kwargs["response_format"]["json_schema"]["name"] == "CompanyProfile"
+    assert completions.kwargs["response_format"]["json_schema"]["strict"] is True
+    assert completions.kwargs["max_tokens"] == PROFILE_MAX_TOKENS
+
+
+def test_call_llm_skips_caching_output_that_fails_validation(monkeypatch):
+    service = LLMService()
+    # Strict schemas drop range constraints, so confidence 5 still gets through
+    completions = _FakeCompletions(
+        '{"company_name": "Acme", "claims": [{"text": "Big", "confidence": 5}]}'
+    )
+    monkeypatch.setattr(service.client.chat, "completions", completions)
+
+    for _ in range(2):
+        asyncio.run(service._call_llm("prompt", cache_tag="profile", schema=CompanyProfile))
+    assert completions.calls == 2
+
+
+def test_call_llm_caches_identical_prompts(monkeypatch):
+    llm = LLMService()
+    completions = _FakeCompletions('{"ok": true}')
+    monkeypatch.setattr(llm.client.chat, "completions", completions)
+
+    for _ in range(2):
+        assert asyncio.run(llm._call_llm("prompt", cache_tag="email")) == '{"ok": true}'
+    assert completions.calls == 1
+
+    # Same prompt from another generator is a separate entry
+    asyncio.run(llm._call_llm("prompt", cache_tag="pitch"))
+    assert completions.calls == 2
+
+
+def test_call_llm_reports_truncated_output(monkeypatch):
+    llm = LLMService()
+    completions = _FakeCompletions('{"company_name": "Ac', finish_reason="length")
+    monkeypatch.setattr(llm.client.chat, "completions", completions)
+
+    with pytest.raises(LLMOutputTruncated, match="2000-token limit"):
+        asyncio.run(llm._call_llm("prompt", max_retries=2, cache_tag="profile"))
+    # Not retried, and nothing cached
+    assert completions.calls == 1
+    assert llm.response_cache.get(llm._cache_key("profile", "prompt")) is None
+
+
+@pytest.mark.parametrize('model, expected', [
+    ("gpt-4-0613", "gpt-4o"),
+    ("gpt-3.5-turbo", "gpt-4o"),
+    ("gpt-4o-mini", "gpt-4o-mini"),
+    ("gpt-4.1", "gpt-4.1"),
+])
+def test_profile_model_ignores_models_without_structured_outputs(monkeypatch, model, expected):
+    monkeypatch.setenv("OPENAI_MODEL", model)
+    assert LLMService().profile_model == expected
+
@@ -1,8 +1,13 @@
 import pytest
-import sys, os
+import sys, os, io, asyncio
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 os.environ.setdefault("OPENAI_API_KEY", "test")
-from services import LLMService, CompanyProfile
+import services
+from services import (
+    LLMService, ExtractionService, CompanyProfile, read_text_prefix,
+    strict_json_schema, truncate_tokens
+)
+from schemas import MeetingSummary
 
 service = LLMService()
 
@@ -12,9 +17,11 @@ whitespace_json = '\n  ' + valid_json + '  \n'
 
 fenced_json = '```json\n' + valid_json + '\n```'
 
+prose_json = 'Here is the profile:\n' + valid_json + '\nLet me know if you need more.'
+
 garbage = 'not json at all'
 
-@pytest.mark.parametrize('text', [valid_json, whitespace_json, fenced_json])
+@pytest.mark.parametrize('text', [valid_json, whitespace_json, fenced_json, prose_json])
 def test_parse_profile_ok(text):
     profile = service._parse_profile_json(text)
     assert isinstance(profile, CompanyProfile)
@@ -24,3 +31,102 @@ def test_parse_profile_ok(text):
 def test_parse_profile_fail():
     with pytest.raises(Exception):
         service._parse_profile_json(garbage)
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.Acme.com/about',
+    'http://acme.com',
+    'https://acme.com:8443/x?y=1',
+    'https://acme.com?ref=http://other.com/',
+    'https://acme.com#team',
+    'HTTPS://WWW.ACME.COM',
+    'https://user@acme.co.uk/path',
+    '//www.acme.com/x',
+    '//acme.com',
+])
+def test_extract_domain_matches_urlparse(url):
+    from urllib.parse import urlparse
+    expected = urlparse(url).netloc.lower().removeprefix('www.')
+    assert ExtractionService.extract_domain(url) == expected
+
+def test_extract_domain_without_scheme():
+    assert ExtractionService.extract_domain('www.acme.com/about') == 'acme.com'
+    assert ExtractionService.extract_domain('acme.com/?next=https://x.io') == 'acme.com'
+
+def test_read_text_prefix_chunk_boundaries():
+    text = "héllo wörld — ünïcode " * 50
+    stream = io.BytesIO(text.encode("utf-8"))
+    # 7-byte chunks split multibyte characters across reads
+    assert read_text_prefix(stream, 10_000, chunk_size=7) == text
+
+    prefix = read_text_prefix(io.BytesIO(text.encode("utf-8")), 20, chunk_size=7)
+    assert text.startswith(prefix)
+    assert len(prefix) >= 20
+
+
+def test_parse_html_keeps_title_and_main_text():
+    html = (
+        b"<html><head><title> Acme </title><style>p {}</style></head>"
+        b"<body><nav>menu</nav><script>var x = 1;</script>"
+        b"<main><p>Hello   world</p>\n<p>More&nbsp;&nbsp;text</p></main></body></html>"
+    )
+    page = ExtractionService().parse_html(html)
+    assert page["title"] == "Acme"
+    assert page["text"] == "Hello world More text"
+
+
+class _CharEncoding:
+    """One token per character, so budgets are easy to reason about"""
+
+    def encode(self, text, **kwargs):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def test_truncate_tokens(monkeypatch):
+    monkeypatch.setattr(services, "_token_encoding", lambda: _CharEncoding())
+    assert truncate_tokens("short", 10) == "short"
+    assert truncate_tokens("x" * 50, 10) == "x" * 10
+
+    # Without a tokenizer the budget falls back to characters
+    monkeypatch.setattr(services, "_token_encoding", lambda: None)
+    assert truncate_tokens("x" * 50, 10) == "x" * 10 * services.CHARS_PER_TOKEN
+
+
+def test_strict_json_schema_closes_every_object():
+    schema = strict_json_schema(MeetingSummary.model_json_schema())
+    next_step = schema["$defs"]["NextStep"]
+    for obj in (schema, next_step):
+        assert obj["additionalProperties"] is False
+        assert obj["required"] == list(obj["properties"])
+    # Optional field stays nullable, unsupported keywords are dropped
+    assert next_step["properties"]["due_date"] == {
+        "anyOf": [{"type": "string"}, {"type": "null"}],
+        "description": "Due date if specified"
+    }
+
+
+def test_extract_content_batch_reuses_cached_pages(monkeypatch):
+    extractor = ExtractionService()
+    fetched = []
+
+    async def fake_fetch(session, url):
+        fetched.append(url)
+        if "missing" in url:
+            raise Exception("Failed to extract content: 404")
+        return b"<html><head><title>Acme</title></head><body><p>hi</p></body></html>"
+
+    monkeypatch.setattr(extractor, "fetch_html", fake_fetch)
+
+    first = asyncio.run(extractor.extract_content_batch(None, ["acme.com", "acme.com/missing"]))
+    assert first[0] == {"title": "Acme", "text": "hi", "url": "acme.com"}
+    assert "error" in first[1]
+
+    # Same page spelled differently is served from cache; failures are retried
+    second = asyncio.run(extractor.extract_content_batch(
+        None, ["https://acme.com/", "acme.com/missing"]
+    ))
+    assert second[0] == {"title": "Acme", "text": "hi", "url": "https://acme.com/"}
+    assert fetched == ["acme.com", "acme.com/missing", "acme.com/missing"]
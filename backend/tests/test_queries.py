@@ -0,0 +1,131 @@
+import pytest
+import sys, os, json, subprocess
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "test")
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, Session, create_engine
+from starlette.requests import Request
+from models import Account, Activity, Source
+from schemas import MeetingSummary, NextStep
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def seed_accounts(engine, count, start=0):
+    with Session(engine) as session:
+        for i in range(start, start + count):
+            account = Account(name=f"Company {i}", domain=f"company{i}.com")
+            account.sources = [Source(url=f"https://company{i}.com", status="success")]
+            session.add(account)
+        session.commit()
+
+
+def count_queries(engine, fn):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return result, statements
+
+
+def make_request(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/accounts", "headers": raw})
+
+
+@pytest.mark.parametrize('count', [1, 10])
+def test_list_accounts_constant_queries(main_module, engine, count):
+    seed_accounts(engine, count)
+    main_module._listing_cache.clear()
+    with Session(engine) as session:
+        response, statements = count_queries(
+            engine, lambda: main_module.list_accounts(make_request(), session=session)
+        )
+    assert len(json.loads(response.body)) == count
+    # table fingerprint + account list, independent of account count
+    assert len(statements) == 2
+
+
+def test_list_accounts_etag(main_module, engine):
+    seed_accounts(engine, 3)
+    main_module._listing_cache.clear()
+    with Session(engine) as session:
+        first = main_module.list_accounts(make_request(), session=session)
+        etag = first.headers["etag"]
+
+        cached, statements = count_queries(
+            engine, lambda: main_module.list_accounts(make_request(), session=session)
+        )
+        assert cached.body == first.body
+        assert len(statements) == 1
+
+        not_modified = main_module.list_accounts(
+            make_request({"If-None-Match": etag}), session=session
+        )
+        assert not_modified.status_code == 304
+
+    seed_accounts(engine, 1, start=3)
+    with Session(engine) as session:
+        changed = main_module.list_accounts(
+            make_request({"If-None-Match": etag}), session=session
+        )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(json.loads(changed.body)) == 4
+
+
+def test_activity_content_round_trips_dates(engine):
+    seed_accounts(engine, 1)
+    summary = MeetingSummary(
+        summary="Intro call",
+        next_steps=[NextStep(owner="Sam", task="Send pricing", due_date="2026-01-15")]
+    )
+    with Session(engine) as session:
+        session.add(Activity(account_id=1, type="call_summary", content=summary.model_dump()))
+        session.commit()
+
+    with Session(engine) as session:
+        activity = session.get(Activity, 1)
+        assert activity.content["next_steps"][0]["due_date"] == "2026-01-15"
+
+
+def test_schema_check_flags_old_database():
+    from models import find_schema_problems
+    old_engine = create_engine("sqlite://", poolclass=StaticPool)
+    with old_engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE sources (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, "
+            "url VARCHAR NOT NULL, title VARCHAR NOT NULL, raw_text VARCHAR NOT NULL, "
+            "fetched_at DATETIME NOT NULL, status VARCHAR NOT NULL)"
+        )
+    SQLModel.metadata.create_all(old_engine)
+
+    problems = find_schema_problems(old_engine)
+    assert "sources.fetched_at has no server default" in problems
+    assert "sources is missing unique index ix_source_account_url" in problems
+    assert not any(problem.startswith("accounts") for problem in problems)
+
+
+def test_schema_check_accepts_current_database(engine):
+    from models import find_schema_problems
+    assert find_schema_problems(engine) == []
+
+
+@pytest.mark.parametrize('url', ["sqlite://", "sqlite:///:memory:"])
+def test_models_import_with_in_memory_sqlite(url):
+    result = subprocess.run(
+        [sys.executable, "-c", "import models; models.create_db_and_tables()"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "DATABASE_URL": url},
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr